@@ -0,0 +1,38 @@
+"""
+Intent Analysis Module
+
+Provides multilingual query understanding for skill matching:
+- Language detection and language-aware tokenization
+- Mock translation of Korean/Japanese queries to English
+- Keyword-based skill matching against SKILL.md metadata
+"""
+
+from .matcher import Skill, SkillMatch, SkillMatcher
+from .tokenizer import (
+    detect_language,
+    smart_tokenize,
+    smart_tokenize_batch,
+    tokenize_japanese,
+    tokenize_korean,
+)
+from .translator import (
+    get_translation_suggestion,
+    mock_translate,
+    translate_queries_batch,
+    translate_query,
+)
+
+__all__ = [
+    "detect_language",
+    "smart_tokenize",
+    "smart_tokenize_batch",
+    "tokenize_japanese",
+    "tokenize_korean",
+    "mock_translate",
+    "translate_queries_batch",
+    "translate_query",
+    "get_translation_suggestion",
+    "Skill",
+    "SkillMatch",
+    "SkillMatcher",
+]
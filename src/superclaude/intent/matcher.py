@@ -0,0 +1,253 @@
+"""
+Keyword-Based Skill Matching
+
+Loads SKILL.md metadata from a skills directory and scores user
+queries against each skill's keywords. Non-English queries should be
+translated first (see translator.py) since skill metadata is English.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+from .tokenizer import smart_tokenize
+
+# Stop words excluded from skill keywords to keep scoring focused on
+# meaningful terms.
+_STOP_WORDS = {
+    "a", "an", "and", "any", "are", "as", "at", "be", "before", "by",
+    "for", "from", "in", "is", "it", "of", "on", "or", "the", "to",
+    "use", "with",
+}
+
+
+@dataclass
+class Skill:
+    """Metadata for one skill loaded from its SKILL.md frontmatter"""
+
+    name: str
+    description: str
+    path: Path
+    keywords: Set[str] = field(default_factory=set)
+
+
+class SkillMatch(NamedTuple):
+    """One scored match returned by SkillMatcher.match"""
+
+    skill: Skill
+    score: float
+
+
+def _score_skills(
+    tokens: List[str],
+    skills: List[Skill],
+    kw_flat: Tuple[str, ...],
+    kw_skill_ids: Tuple[int, ...],
+    kw_hashes: Tuple[int, ...],
+) -> List[SkillMatch]:
+    """
+    Score every skill against a tokenized query
+
+    Module-level scoring kernel over the matcher's flattened keyword
+    columns: one linear zip over (keyword hash, keyword, skill id)
+    triples replaces the per-skill object walk, so the scan touches
+    contiguous tuples instead of chasing keyword sets across
+    heap-scattered Skill objects. Keywords are pre-hashed to 32-bit
+    ints at load time; the scan probes a small int set first and only
+    touches the string (guarding against masked-hash collisions) on a
+    hash hit. Token multiplicity is preserved by counting tokens first,
+    so duplicate query tokens still score as before.
+    """
+    token_counts: Dict[str, int] = {}
+    for token in tokens:
+        token_counts[token] = token_counts.get(token, 0) + 1
+    token_hashes = {hash(token) & 0xFFFFFFFF for token in token_counts}
+
+    hits = [0] * len(skills)
+    get = token_counts.get
+    for keyword_hash, keyword, skill_id in zip(kw_hashes, kw_flat, kw_skill_ids):
+        if keyword_hash in token_hashes:
+            count = get(keyword)
+            if count:
+                hits[skill_id] += count
+
+    inv_count = 1.0 / len(tokens)
+    return [
+        SkillMatch(skill=skills[skill_id], score=hit_count * inv_count)
+        for skill_id, hit_count in enumerate(hits)
+        if hit_count
+    ]
+
+
+class SkillMatcher:
+    """
+    Match user queries against skills by keyword overlap
+
+    Usage:
+        matcher = SkillMatcher(skills_dir)
+        results = matcher.match("confidence check before implementing")
+
+        if results and results[0].score > 0.3:
+            # Recommend results[0].skill
+    """
+
+    def __init__(self, skills_dir):
+        self.skills_dir = Path(skills_dir)
+        self.skills = self._load_skills()
+        # SoA columns for the scoring kernel: all keywords flattened
+        # into one tuple with a parallel tuple of owning-skill indices.
+        # Tuples rather than numpy arrays — the matcher has no
+        # third-party dependencies and skill counts are small.
+        self._kw_flat: Tuple[str, ...] = tuple(
+            keyword for skill in self.skills for keyword in skill.keywords
+        )
+        self._kw_skill_ids: Tuple[int, ...] = tuple(
+            index
+            for index, skill in enumerate(self.skills)
+            for _ in skill.keywords
+        )
+        # Keywords hashed once to 32-bit ints: the scoring scan probes
+        # these before touching the strings themselves.
+        self._kw_hashes: Tuple[int, ...] = tuple(
+            hash(keyword) & 0xFFFFFFFF for keyword in self._kw_flat
+        )
+
+    @classmethod
+    def default(cls, skills_dir) -> "SkillMatcher":
+        """
+        Shared matcher for a skills directory
+
+        Memoized per directory, so independent callers (CLI commands,
+        test modules) reuse one parsed instance instead of re-walking
+        the skills directory. The key is the string form of the path so
+        Path and str callers share the same entry.
+
+        Args:
+            skills_dir: Directory containing <skill>/SKILL.md entries
+
+        Returns:
+            The shared SkillMatcher for that directory
+        """
+        return _default_matcher(str(skills_dir))
+
+    def __getstate__(self):
+        """
+        Drop the hash column when pickling
+
+        str hashes are salted per process (PYTHONHASHSEED), so hashes
+        carried over from another process would never match the current
+        process's query-token hashes.
+        """
+        state = self.__dict__.copy()
+        del state["_kw_hashes"]
+        return state
+
+    def __setstate__(self, state):
+        """Recompute the hash column with this process's hash salt"""
+        self.__dict__.update(state)
+        self._kw_hashes = tuple(
+            hash(keyword) & 0xFFFFFFFF for keyword in self._kw_flat
+        )
+
+    def _load_skills(self) -> List[Skill]:
+        """
+        Load all skills from <skills_dir>/*/SKILL.md
+
+        Returns:
+            List of Skill objects (empty if the directory is missing)
+        """
+        skills = []
+        if not self.skills_dir.is_dir():
+            return skills
+
+        for skill_file in sorted(self.skills_dir.glob("*/SKILL.md")):
+            frontmatter = self._parse_frontmatter(skill_file.read_text(encoding="utf-8"))
+            if not frontmatter:
+                continue
+
+            name = frontmatter.get("name", skill_file.parent.name)
+            description = frontmatter.get("description", "")
+            keywords = self._extract_keywords(name, description)
+            skills.append(
+                Skill(
+                    name=name,
+                    description=description,
+                    path=skill_file,
+                    keywords=keywords,
+                )
+            )
+
+        return skills
+
+    def _parse_frontmatter(self, content: str) -> dict:
+        """
+        Parse the YAML-ish frontmatter block of a SKILL.md file
+
+        Only flat 'key: value' pairs are needed for matching, so this
+        avoids a YAML dependency.
+
+        Args:
+            content: Full SKILL.md content
+
+        Returns:
+            Dict of frontmatter fields (empty if no frontmatter)
+        """
+        match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
+        if not match:
+            return {}
+
+        fields = {}
+        for line in match.group(1).splitlines():
+            if ":" in line:
+                key, _, value = line.partition(":")
+                fields[key.strip().lower()] = value.strip()
+        return fields
+
+    def _extract_keywords(self, name: str, description: str) -> Set[str]:
+        """
+        Derive matching keywords from a skill's name and description
+
+        Args:
+            name: Skill name (may be kebab-case or title case)
+            description: Skill description sentence(s)
+
+        Returns:
+            Set of lowercase keyword tokens
+        """
+        text = f"{name.replace('-', ' ')} {description}"
+        tokens = re.findall(r"[a-z0-9]+", text.lower())
+        return {t for t in tokens if len(t) > 1 and t not in _STOP_WORDS}
+
+    def match(self, query: str, limit: int = 3) -> List[SkillMatch]:
+        """
+        Score the query against every skill and return the best matches
+
+        Score is the fraction of query tokens found in the skill's
+        keywords, so English (or translated) queries score higher than
+        untranslated ones.
+
+        Args:
+            query: User query (ideally English or translated)
+            limit: Maximum number of matches to return
+
+        Returns:
+            List of SkillMatch sorted by descending score; matches
+            with zero score are omitted
+        """
+        tokens = smart_tokenize(query)
+        if not tokens:
+            return []
+
+        results = _score_skills(
+            tokens, self.skills, self._kw_flat, self._kw_skill_ids, self._kw_hashes
+        )
+        results.sort(key=lambda m: m.score, reverse=True)
+        return results[:limit]
+
+
+@lru_cache(maxsize=4)
+def _default_matcher(skills_dir: str) -> SkillMatcher:
+    """Memoized builder behind SkillMatcher.default"""
+    return SkillMatcher(skills_dir)
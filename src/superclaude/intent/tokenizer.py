@@ -0,0 +1,215 @@
+"""
+Language-Aware Query Tokenization
+
+Splits user queries into tokens suitable for keyword matching:
+- Korean: Hangul runs and Latin/digit runs
+- Japanese: script-boundary segmentation (hiragana/katakana/kanji runs)
+- Chinese: Han runs and Latin/digit runs
+- English and other Latin-script input: lowercase whitespace split
+
+Used by the skill matcher to turn free-form (possibly non-English)
+queries into comparable keyword tokens.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_right
+from typing import List
+
+# Sorted script-range boundaries for Japanese character classification.
+# Each boundary opens the category stored at the same index in
+# _RANGE_CATS; None marks the gaps between scripts. Classification is a
+# single bisect instead of a chain of range comparisons per character.
+_RANGE_BOUNDS = (0x3040, 0x30A0, 0x3100, 0x4E00, 0xA000)
+_RANGE_CATS = ("hiragana", "katakana", None, "kanji", None)
+
+# Compiled once at import; shared across tokenizers and detect_language
+# so the same character ranges are not recompiled (or re-fetched from
+# the re cache) on every call.
+_HANGUL_RE = re.compile(r"[\uac00-\ud7a3]")
+_KANA_RE = re.compile(r"[\u3040-\u309f\u30a0-\u30ff]")
+_HAN_RE = re.compile(r"[\u4e00-\u9fff]")
+_KO_OR_LATIN_RE = re.compile(r"[\uac00-\ud7a3]+|[a-z0-9]+")
+_CJK_OR_LATIN_RE = re.compile(r"[\u4e00-\u9fff]+|[a-z0-9]+")
+
+# 128-entry lookup table: 1 where the (already lowercased) codepoint is
+# an ASCII letter or digit. One indexed load replaces the chained range
+# comparisons in the tokenizer loop.
+_ASCII_LATIN = bytes(
+    1 if 0x61 <= i <= 0x7A or 0x30 <= i <= 0x39 else 0 for i in range(128)
+)
+
+
+def detect_language(text: str) -> str:
+    """
+    Detect the dominant language of a query
+
+    Args:
+        text: Raw user query
+
+    Returns:
+        Language code: 'ko', 'ja', or 'en'
+
+    Note:
+        Han-only text is indistinguishable from kanji-only Japanese
+        without a dictionary, so it is classified as 'ja' rather than
+        'zh'.
+    """
+    # Pure-ASCII input (the common case) cannot contain CJK characters,
+    # so skip all range scans.
+    if text.isascii():
+        return "en"
+
+    if _HANGUL_RE.search(text):
+        return "ko"
+    if _KANA_RE.search(text):
+        return "ja"
+    if _HAN_RE.search(text):
+        return "ja"
+    return "en"
+
+
+def tokenize_korean(text: str) -> List[str]:
+    """
+    Tokenize Korean text into Hangul runs and Latin/digit runs
+
+    Args:
+        text: Query text containing Hangul
+
+    Returns:
+        List of lowercase tokens
+    """
+    return _KO_OR_LATIN_RE.findall(text.lower())
+
+
+def tokenize_japanese(text: str) -> List[str]:
+    """
+    Tokenize Japanese text at script boundaries
+
+    Consecutive characters of the same script (hiragana, katakana,
+    kanji, or Latin/digit) form one token; everything else separates
+    tokens. Script classification uses a bisect over sorted range
+    boundaries instead of per-character chained comparisons.
+
+    Args:
+        text: Query text containing kana/kanji
+
+    Returns:
+        List of lowercase tokens
+    """
+    tokens: List[str] = []
+    start = 0
+    current_type = None
+
+    # Bind hot names to locals so the loop avoids repeated global and
+    # attribute lookups on every character.
+    bounds = _RANGE_BOUNDS
+    cats = _RANGE_CATS
+    ascii_latin = _ASCII_LATIN
+    classify = bisect_right
+    emit = tokens.append
+
+    lowered = text.lower()
+    # Convert the whole string to codepoints in one C-level pass instead
+    # of calling ord() per character inside the loop.
+    codes = list(map(ord, lowered))
+
+    # Track token boundaries as indices and emit one slice per token
+    # instead of growing an accumulator string character by character.
+    for i, code in enumerate(codes):
+        if code < 128:
+            char_type = "latin" if ascii_latin[code] else None
+        else:
+            idx = classify(bounds, code) - 1
+            char_type = cats[idx] if idx >= 0 else None
+
+        if char_type != current_type:
+            if current_type is not None:
+                emit(lowered[start:i])
+            start = i
+            current_type = char_type
+
+    if current_type is not None:
+        emit(lowered[start:])
+
+    return tokens
+
+
+def _tokenize_chinese(text: str) -> List[str]:
+    """
+    Tokenize Chinese text into Han runs and Latin/digit runs
+
+    Kept private: detect_language never returns 'zh' (Han-only text is
+    treated as Japanese), so this is not part of the dispatch table or
+    the public API.
+
+    Args:
+        text: Query text containing Han characters
+
+    Returns:
+        List of lowercase tokens
+    """
+    return _CJK_OR_LATIN_RE.findall(text.lower())
+
+
+def _default_tokenize(text: str) -> List[str]:
+    """Lowercase whitespace split for English and unknown languages"""
+    return text.lower().split()
+
+
+# Table-driven dispatch: one dict lookup instead of an if/elif chain
+# per query.
+_TOKENIZERS = {
+    "ko": tokenize_korean,
+    "ja": tokenize_japanese,
+}
+
+
+def _tokenize_non_ascii(text: str) -> List[str]:
+    """
+    Normalize and tokenize a query that contains non-ASCII characters
+
+    NFKC collapses full-width ASCII and half-width kana variants so the
+    classifier and downstream keyword matching see canonical forms.
+    """
+    text = unicodedata.normalize("NFKC", text)
+    return _TOKENIZERS.get(detect_language(text), _default_tokenize)(text)
+
+
+def smart_tokenize(text: str) -> List[str]:
+    """
+    Tokenize a query using the tokenizer for its detected language
+
+    Args:
+        text: Raw user query in any supported language
+
+    Returns:
+        List of lowercase tokens
+    """
+    # Fast path: pure-ASCII queries dominate real traffic and need no
+    # language detection at all.
+    if text.isascii():
+        return _default_tokenize(text)
+
+    return _tokenize_non_ascii(text)
+
+
+def smart_tokenize_batch(texts: List[str]) -> List[List[str]]:
+    """
+    Tokenize many queries in one call
+
+    Binds the dispatch machinery once and runs a tight loop, which
+    amortizes setup overhead for corpus indexing and test sweeps.
+
+    Args:
+        texts: List of raw queries in any supported languages
+
+    Returns:
+        List of token lists, one per input query in order
+    """
+    default = _default_tokenize
+    non_ascii = _tokenize_non_ascii
+    return [
+        default(text) if text.isascii() else non_ascii(text)
+        for text in texts
+    ]
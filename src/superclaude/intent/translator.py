@@ -0,0 +1,310 @@
+"""
+Mock Translation Layer for Non-English Queries
+
+Translates common Korean/Japanese development phrases to English so
+that queries in those languages can be matched against the English
+keywords in SKILL.md metadata.
+
+The phrase dictionaries cover frequent request patterns ("구현해줘",
+"作って", ...) rather than attempting full translation. A real
+translation backend can be plugged in later behind the same API
+(use_mock=False).
+"""
+
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from .tokenizer import detect_language
+
+# Korean phrase -> English. Longer phrases first so multi-word phrases
+# win over their sub-phrases during replacement.
+_KO_TRANSLATIONS: Dict[str, str] = {
+    "로그인 페이지": "login page",
+    "회원가입 페이지": "signup page",
+    "구현하기 전에": "before implementing",
+    "확신도 체크해줘": "confidence check",
+    "확신도": "confidence",
+    "구현해줘": "implement",
+    "만들어줘": "build",
+    "짜줘": "write code",
+    "고쳐줘": "fix",
+    "해결해줘": "solve",
+    "분석해줘": "analyze",
+    "설명해줘": "explain",
+    "체크해줘": "check",
+    "검증해줘": "validate",
+    "최적화": "optimize",
+    "리팩토링": "refactoring",
+    "테스트": "test",
+    "에러": "error",
+    "버그": "bug",
+    "안돼": "not working",
+    "느려": "slow",
+    "페이지": "page",
+    "로그인": "login",
+}
+
+# Japanese phrase -> English.
+_JA_TRANSLATIONS: Dict[str, str] = {
+    "ログインページ": "login page",
+    "実装して": "implement",
+    "作って": "build",
+    "直して": "fix",
+    "分析して": "analyze",
+    "説明して": "explain",
+    "最適化": "optimize",
+    "テスト": "test",
+    "エラー": "error",
+    "バグ": "bug",
+    "遅い": "slow",
+    "ページ": "page",
+    "ログイン": "login",
+}
+
+# Normalize phrase keys to NFKC (matching query normalization below)
+# and intern them once at import so dict probes for recurring queries
+# can short-circuit on pointer identity instead of a full hash+compare
+# of the Unicode payload.
+_KO_TRANSLATIONS = {
+    sys.intern(unicodedata.normalize("NFKC", k)): v
+    for k, v in _KO_TRANSLATIONS.items()
+}
+_JA_TRANSLATIONS = {
+    sys.intern(unicodedata.normalize("NFKC", k)): v
+    for k, v in _JA_TRANSLATIONS.items()
+}
+
+
+def _compile_phrase_pattern(table: Dict[str, str]) -> "re.Pattern[str]":
+    """
+    Compile a dictionary's phrases into one alternation pattern
+
+    A single compiled multi-pattern scan walks the query once (the re
+    engine's alternation plays the role of an Aho-Corasick automaton
+    here) instead of one substring scan per dictionary entry. Longer
+    phrases come first so "로그인 페이지" wins over "로그인".
+    """
+    phrases = sorted(table, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, phrases)))
+
+
+_KO_PATTERN = _compile_phrase_pattern(_KO_TRANSLATIONS)
+_JA_PATTERN = _compile_phrase_pattern(_JA_TRANSLATIONS)
+
+# Katakana -> romaji table for loanwords the phrase dictionary leaves
+# untranslated ("サーバー", "コード", ...). str.translate runs as one
+# C-level pass over the string. This is a crude per-character
+# romanization for keyword matching, not linguistically exact Hepburn:
+# the long-vowel mark is dropped and small kana are expanded naively.
+_KANA_TABLE = str.maketrans({
+    "ア": "a", "イ": "i", "ウ": "u", "エ": "e", "オ": "o",
+    "カ": "ka", "キ": "ki", "ク": "ku", "ケ": "ke", "コ": "ko",
+    "サ": "sa", "シ": "shi", "ス": "su", "セ": "se", "ソ": "so",
+    "タ": "ta", "チ": "chi", "ツ": "tsu", "テ": "te", "ト": "to",
+    "ナ": "na", "ニ": "ni", "ヌ": "nu", "ネ": "ne", "ノ": "no",
+    "ハ": "ha", "ヒ": "hi", "フ": "fu", "ヘ": "he", "ホ": "ho",
+    "マ": "ma", "ミ": "mi", "ム": "mu", "メ": "me", "モ": "mo",
+    "ヤ": "ya", "ユ": "yu", "ヨ": "yo",
+    "ラ": "ra", "リ": "ri", "ル": "ru", "レ": "re", "ロ": "ro",
+    "ワ": "wa", "ヲ": "wo", "ン": "n",
+    "ガ": "ga", "ギ": "gi", "グ": "gu", "ゲ": "ge", "ゴ": "go",
+    "ザ": "za", "ジ": "ji", "ズ": "zu", "ゼ": "ze", "ゾ": "zo",
+    "ダ": "da", "ヂ": "ji", "ヅ": "zu", "デ": "de", "ド": "do",
+    "バ": "ba", "ビ": "bi", "ブ": "bu", "ベ": "be", "ボ": "bo",
+    "パ": "pa", "ピ": "pi", "プ": "pu", "ペ": "pe", "ポ": "po",
+    "ァ": "a", "ィ": "i", "ゥ": "u", "ェ": "e", "ォ": "o",
+    "ャ": "ya", "ュ": "yu", "ョ": "yo", "ッ": "",
+    "ヴ": "vu", "ー": "",
+})
+
+# Leading bigram of every dictionary phrase: a Bloom-filter-style
+# prefilter. A phrase can only match if its first two characters occur
+# somewhere in the query, so queries sharing no bigram with the
+# dictionary skip the full pattern scan.
+_KO_BIGRAMS = frozenset(phrase[:2] for phrase in _KO_TRANSLATIONS)
+_JA_BIGRAMS = frozenset(phrase[:2] for phrase in _JA_TRANSLATIONS)
+
+
+@lru_cache(maxsize=5000)
+def mock_translate(query: str, target: str = "en", lang: Optional[str] = None) -> str:
+    """
+    Translate known Korean/Japanese phrases in a query to English
+
+    Unknown phrases are left as-is, so the result may be mixed-language
+    for queries outside the dictionary.
+
+    Pure function of its arguments, so results are memoized: repeat
+    queries (skill scoring retries, test sweeps) become one dict hit
+    instead of a detection pass plus the phrase scan.
+
+    Args:
+        query: Raw user query
+        target: Target language code (only 'en' is supported)
+        lang: Pre-detected language code; pass it when the caller has
+            already run detect_language to avoid a redundant scan
+
+    Returns:
+        Query with known phrases replaced by English equivalents
+    """
+    # Nothing to translate in empty, whitespace-only, or pure-ASCII
+    # input; isascii is a single C-level scan and covers the common
+    # English production path before any normalization or detection.
+    if not query or query.isascii() or query.isspace():
+        return query
+
+    # NFKC collapses full-width/half-width variants so exact phrase
+    # matching works regardless of the query's normalization form.
+    query = unicodedata.normalize("NFKC", query)
+
+    if lang is None:
+        lang = detect_language(query)
+    if lang == "ko":
+        table, pattern, bigrams = _KO_TRANSLATIONS, _KO_PATTERN, _KO_BIGRAMS
+    elif lang == "ja":
+        table, pattern, bigrams = _JA_TRANSLATIONS, _JA_PATTERN, _JA_BIGRAMS
+    else:
+        return query
+
+    # Prefilter: no shared leading bigram means no phrase can match,
+    # so out-of-dictionary queries skip the scan entirely.
+    query_bigrams = {query[i:i + 2] for i in range(len(query) - 1)}
+    if query_bigrams & bigrams:
+        # One pass over the query: the alternation matches every known
+        # phrase in a single scan, replacing the per-entry substring
+        # loop. Each replacement is padded with spaces — CJK text has
+        # no word separators, so adjacent phrases ("에러페이지") would
+        # otherwise fuse into single tokens ("errorpage") that match no
+        # skill keyword.
+        translated = pattern.sub(
+            lambda match: f" {table[match.group()]} ", query
+        )
+    else:
+        translated = query
+
+    # Japanese only: romanize katakana the dictionary did not cover, so
+    # leftover loanwords become Latin tokens the matcher can at least
+    # tokenize alongside the translated phrases. The padding above also
+    # keeps romanized runs from fusing with neighbouring replacements.
+    if lang == "ja":
+        translated = translated.translate(_KANA_TABLE)
+
+    # Collapse the padding (and any doubled spaces it produced) once at
+    # the end; untouched queries pass through without re-spacing.
+    if translated != query:
+        translated = " ".join(translated.split())
+    return translated
+
+
+@lru_cache(maxsize=5000)
+def _translate_mock_cached(query: str, target: str, lang: str) -> str:
+    """
+    Cached mock-translation path
+
+    Skill scoring retries the same query repeatedly within a session;
+    caching turns those repeats into a dict hit instead of re-running
+    detection plus the phrase scan. The language is part of the key
+    only because a given query always detects the same way.
+    """
+    return mock_translate(query, target, lang=lang)
+
+
+def translate_query(
+    query: str,
+    target: str = "en",
+    use_mock: bool = True,
+    lang: Optional[str] = None,
+) -> str:
+    """
+    Translate a non-English query to the target language
+
+    English queries pass through unchanged.
+
+    Args:
+        query: Raw user query
+        target: Target language code (only 'en' is supported)
+        use_mock: Use the built-in phrase dictionary (a real backend is
+            not yet wired up)
+        lang: Pre-detected language code; pass it when the caller has
+            already run detect_language to avoid a redundant scan
+
+    Returns:
+        Translated query, or the original query when no translation
+        applies
+    """
+    if not query or query.isascii() or query.isspace():
+        return query
+
+    query = unicodedata.normalize("NFKC", query)
+
+    if lang is None:
+        lang = detect_language(query)
+    if lang == "en":
+        return query
+
+    if use_mock:
+        return _translate_mock_cached(query, target, lang)
+
+    raise NotImplementedError("Real translation backend is not configured")
+
+
+def translate_queries_batch(
+    queries: List[str],
+    target: str = "en",
+    use_mock: bool = True,
+) -> List[str]:
+    """
+    Translate many queries in one call
+
+    Amortizes dispatch overhead over the batch for corpus indexing and
+    test sweeps, and gives a real backend (use_mock=False, once wired
+    up) the hook to send one batched request instead of one round-trip
+    per query.
+
+    Args:
+        queries: Raw user queries in any supported languages
+        target: Target language code (only 'en' is supported)
+        use_mock: Use the built-in phrase dictionary
+
+    Returns:
+        Translated queries, one per input in order
+    """
+    translate = translate_query
+    return [translate(query, target, use_mock=use_mock) for query in queries]
+
+
+def get_translation_suggestion(query: str) -> Optional[Dict[str, str]]:
+    """
+    Suggest an English translation for a non-English query
+
+    Args:
+        query: Raw user query
+
+    Returns:
+        Dict with 'original', 'language', and 'translated' keys, or
+        None when the query is English or no translation applies
+    """
+    # ASCII queries are English as far as the dictionaries are
+    # concerned; nothing to suggest.
+    if not query or query.isascii():
+        return None
+
+    # Detect on the same NFKC form translate_query matches against, so
+    # half-width katakana ("ｴﾗｰ") detects as Japanese here just as it
+    # translates there.
+    normalized = unicodedata.normalize("NFKC", query)
+    lang = detect_language(normalized)
+    if lang == "en":
+        return None
+
+    translated = translate_query(normalized, lang=lang)
+    if translated == normalized:
+        return None
+
+    return {
+        "original": query,
+        "language": lang,
+        "translated": translated,
+    }
@@ -0,0 +1,17 @@
+"""
+Skill Tooling
+
+Bundled skill assets live in the subdirectories next to this module
+(one directory per skill, each with a SKILL.md). This package provides
+tooling for working with those assets, starting with frontmatter
+validation (validator.py).
+"""
+
+from .validator import SkillValidator, ValidationError, ValidationResult, validate_skill
+
+__all__ = [
+    "SkillValidator",
+    "ValidationError",
+    "ValidationResult",
+    "validate_skill",
+]
@@ -0,0 +1,724 @@
+"""
+SKILL.md Frontmatter Validator
+
+Validates the YAML frontmatter of skill definition files:
+- Basic info: name, description, version, category, complexity
+- Intents: trigger patterns (must compile) and example phrases
+- Auto-trigger: enabled flag and confidence threshold
+- Arguments: name/type/required/description/infer_from per argument
+- Examples: usage example list
+
+Usage:
+    python -m superclaude.skills.validator skills/*/SKILL.md
+
+Exit Codes:
+    0 - All files valid
+    1 - At least one file invalid (or warning in --strict mode)
+"""
+
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+# Compiled once at import: batch runs over many skill files pay the
+# re-cache lookup per call otherwise.
+_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
+# PyYAML is only needed once a file is actually parsed. Importing it
+# lazily keeps `from superclaude.skills.validator import ValidationError`
+# (tooling that merely consumes results) free of the yaml import cost.
+_yaml = None
+_yaml_loader = None
+
+
+def _load_yaml():
+    """Import PyYAML on first use and pick the fastest available loader
+
+    libyaml's C loader parses ~2-10x faster than the pure-Python
+    SafeLoader; fall back transparently when PyYAML was built without it.
+    """
+    global _yaml, _yaml_loader
+    if _yaml is None:
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as _Loader
+        except ImportError:
+            from yaml import SafeLoader as _Loader
+        _yaml, _yaml_loader = yaml, _Loader
+    return _yaml, _yaml_loader
+
+# Messages repeated across sections: interned once here instead of
+# rebuilt as new string objects (or duplicated literals) at each site.
+_MSG_BOOL = "Must be boolean (true/false)"
+_MSG_STRING = "Must be a string"
+_MSG_NONEMPTY_ARRAY = "Must be a non-empty array"
+_MSG_REQUIRED_MISSING = "Required field '{}' is missing"
+
+# Identity sentinels distinguishing "file missing" and "file exists
+# but could not be read" from "frontmatter missing or malformed"
+# (None) in _parse_frontmatter.
+_FILE_NOT_FOUND: Dict = {}
+_READ_ERROR: Dict = {}
+
+
+@lru_cache(maxsize=1024)
+def _try_compile(pattern: str) -> bool:
+    """
+    True when the intent pattern compiles as a regex
+
+    Memoized across files: many skills share boilerplate trigger
+    patterns, so batch runs compile each distinct pattern once.
+    """
+    try:
+        re.compile(pattern)
+    except re.error:
+        return False
+    return True
+
+
+def _is_kebab_case(name: str) -> bool:
+    """
+    True for lowercase kebab-case identifiers (my-skill, a2b)
+
+    Skill names are short (< 30 chars), so a direct character scan
+    beats entering the regex engine.
+    """
+    if not name or name[0] == "-" or name[-1] == "-" or "--" in name:
+        return False
+    return all(c == "-" or "a" <= c <= "z" or "0" <= c <= "9" for c in name)
+
+
+def _is_snake_case(name: str) -> bool:
+    """True for lowercase snake_case identifiers (target_file, _tmp)"""
+    if not name:
+        return False
+    first = name[0]
+    if first != "_" and not ("a" <= first <= "z"):
+        return False
+    return all(c == "_" or "a" <= c <= "z" or "0" <= c <= "9" for c in name)
+
+
+@dataclass(slots=True, frozen=True)
+class ValidationError:
+    """One validation finding (used for both errors and warnings)"""
+
+    field: str
+    message: str
+    suggestion: str = ""
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Validation outcome for a single SKILL.md file"""
+
+    file_path: str
+    errors: List[ValidationError] = field(default_factory=list)
+    warnings: List[ValidationError] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """True when no errors were found (warnings are allowed)"""
+        return len(self.errors) == 0
+
+    def add_error(self, field_name: str, message: str, suggestion: str = "") -> None:
+        """Record a blocking validation error"""
+        self.errors.append(ValidationError(field_name, message, suggestion))
+
+    def add_warning(self, field_name: str, message: str, suggestion: str = "") -> None:
+        """Record a non-blocking validation warning"""
+        self.warnings.append(ValidationError(field_name, message, suggestion))
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize for the on-disk validation cache"""
+        return {
+            "file_path": self.file_path,
+            "errors": [asdict(e) for e in self.errors],
+            "warnings": [asdict(w) for w in self.warnings],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "ValidationResult":
+        """Rebuild a result from its cached form"""
+        return cls(
+            file_path=data["file_path"],
+            errors=[ValidationError(**e) for e in data["errors"]],
+            warnings=[ValidationError(**w) for w in data["warnings"]],
+        )
+
+    def __str__(self) -> str:
+        if self.valid and not self.warnings:
+            return f"✅ {self.file_path}: valid"
+
+        status = "✅" if self.valid else "❌"
+        lines = [
+            f"{status} {self.file_path}: "
+            f"{len(self.errors)} error(s), {len(self.warnings)} warning(s)"
+        ]
+        # One extend per block instead of per-line append dispatch.
+        lines.extend(
+            line
+            for error in self.errors
+            for line in (
+                (f"  ❌ {error.field}: {error.message}",
+                 f"     💡 {error.suggestion}")
+                if error.suggestion
+                else (f"  ❌ {error.field}: {error.message}",)
+            )
+        )
+        lines.extend(
+            line
+            for warning in self.warnings
+            for line in (
+                (f"  ⚠️  {warning.field}: {warning.message}",
+                 f"     💡 {warning.suggestion}")
+                if warning.suggestion
+                else (f"  ⚠️  {warning.field}: {warning.message}",)
+            )
+        )
+        return "\n".join(lines)
+
+
+class SkillValidator:
+    """
+    Validate SKILL.md frontmatter against the skill schema
+
+    Usage:
+        validator = SkillValidator()
+        result = validator.validate_file(Path("skills/my-skill/SKILL.md"))
+
+        if not result.valid:
+            print(result)
+    """
+
+    REQUIRED_BASIC_FIELDS = frozenset({"name", "description", "version"})
+
+    VALID_CATEGORIES = frozenset({
+        "analysis",
+        "implementation",
+        "quality",
+        "research",
+        "utility",
+        "workflow",
+    })
+    VALID_COMPLEXITIES = frozenset({"simple", "medium", "complex"})
+    VALID_ARG_TYPES = frozenset({"string", "number", "boolean", "array", "object"})
+    VALID_INFER_SOURCES = frozenset({"context", "query", "file", "none"})
+
+    REQUIRED_ARG_FIELDS = frozenset({"name", "type", "required", "description"})
+
+    REQUIRED_INTENT_FIELDS = {"intents": frozenset({"patterns", "examples"})}
+    REQUIRED_AUTO_TRIGGER_FIELDS = {
+        "auto_trigger": frozenset({"enabled", "threshold"})
+    }
+
+    # Suggestion strings rebuilt ", ".join(sorted(...)) on every error
+    # emission; precompute them once per class.
+    _CATEGORIES_STR = ", ".join(sorted(VALID_CATEGORIES))
+    _COMPLEXITIES_STR = ", ".join(sorted(VALID_COMPLEXITIES))
+    _ARG_TYPES_STR = ", ".join(sorted(VALID_ARG_TYPES))
+    _INFER_SOURCES_STR = ", ".join(sorted(VALID_INFER_SOURCES))
+
+    def validate_file(self, path: Path) -> ValidationResult:
+        """
+        Validate one SKILL.md file
+
+        Args:
+            path: Path to the SKILL.md file
+
+        Returns:
+            ValidationResult with all errors and warnings found
+        """
+        result = ValidationResult(file_path=str(path))
+
+        # No up-front exists() check: that costs an extra stat per file
+        # and races against deletion anyway. The open inside
+        # _parse_frontmatter reports a missing file via the sentinel.
+        frontmatter = self._parse_frontmatter(path)
+        if frontmatter is _FILE_NOT_FOUND:
+            result.add_error("file", "File not found")
+            return result
+        if frontmatter is _READ_ERROR:
+            result.add_error("file", "File could not be read")
+            return result
+        if frontmatter is None:
+            result.add_error(
+                "frontmatter",
+                "Failed to parse YAML frontmatter",
+                "Frontmatter must be a YAML mapping between '---' delimiters",
+            )
+            return result
+
+        self._validate_all(frontmatter, result)
+        return result
+
+    def _validate_all(self, frontmatter: Dict, result: ValidationResult) -> None:
+        """
+        Run every section validator in one pass
+
+        The optional sections are fetched from the frontmatter exactly
+        once here; each section validator receives its section directly
+        instead of re-reading (and re-checking for absence of) its key.
+        """
+        self._validate_basic_info(frontmatter, result)
+
+        intents = frontmatter.get("intents")
+        if intents is not None:
+            self._validate_intents(intents, result)
+
+        auto_trigger = frontmatter.get("auto_trigger")
+        if auto_trigger is not None:
+            self._validate_auto_trigger(auto_trigger, result)
+
+        arguments = frontmatter.get("arguments")
+        if arguments is not None:
+            self._validate_arguments(arguments, result)
+
+        examples = frontmatter.get("examples")
+        if examples is not None:
+            self._validate_examples(examples, result)
+
+    def _parse_frontmatter(self, path: Path) -> Optional[Dict]:
+        """
+        Extract and parse the frontmatter block of a SKILL.md file
+
+        Args:
+            path: Path to the SKILL.md file
+
+        Returns:
+            Parsed frontmatter dict, None when the frontmatter is
+            missing or malformed, _FILE_NOT_FOUND when the file itself
+            does not exist, or _READ_ERROR when it exists but cannot
+            be read
+        """
+        # Stream the header instead of materializing the whole file:
+        # memory stays O(frontmatter) regardless of body size, and the
+        # read stops at the closing delimiter. The 200-line budget
+        # guards against unterminated frontmatter.
+        frontmatter_lines: List[str] = []
+        try:
+            handle = path.open(encoding="utf-8")
+        except FileNotFoundError:
+            return _FILE_NOT_FOUND
+        except OSError:
+            # Exists but is unreadable (permissions, a directory, ...):
+            # a different diagnosis than a missing file.
+            return _READ_ERROR
+        try:
+            with handle:
+                if handle.readline().strip() != "---":
+                    return None
+                for line in handle:
+                    if line.strip() == "---":
+                        break
+                    frontmatter_lines.append(line)
+                    if len(frontmatter_lines) > 200:
+                        return None
+                else:
+                    # EOF without a closing delimiter
+                    return None
+        except UnicodeDecodeError:
+            # Not UTF-8 text: report a parse error like any other
+            # malformed frontmatter instead of raising out of the
+            # validator (which would abort a parallel batch run).
+            return None
+        frontmatter_text = "".join(frontmatter_lines)
+
+        # JSON is a subset of YAML, and JSON-styled frontmatter (a brace
+        # -delimited mapping) shows up in generated skills. The C json
+        # parser is several times faster than the YAML loader, so try it
+        # first when the block looks like JSON — but a brace-delimited
+        # block may still be a YAML flow mapping with unquoted keys, so
+        # a JSON parse failure falls through to the YAML loader rather
+        # than rejecting the file.
+        frontmatter = None
+        if frontmatter_text.lstrip().startswith("{"):
+            import json
+
+            try:
+                frontmatter = json.loads(frontmatter_text)
+            except ValueError:
+                frontmatter = None
+        if frontmatter is None:
+            yaml, loader = _load_yaml()
+            try:
+                frontmatter = yaml.load(frontmatter_text, Loader=loader)
+            except yaml.YAMLError:
+                return None
+
+        if not isinstance(frontmatter, dict):
+            return None
+        return frontmatter
+
+    def _validate_basic_info(self, frontmatter: Dict, result: ValidationResult) -> None:
+        """Validate name, description, version, category, complexity"""
+        # Bound methods resolved once instead of per finding; this is
+        # the hottest validator on large batches.
+        add_error = result.add_error
+        add_warning = result.add_warning
+
+        # One C-level set difference instead of a per-field membership
+        # loop; sorted so the report order is deterministic.
+        for field_name in sorted(self.REQUIRED_BASIC_FIELDS - frontmatter.keys()):
+            add_error(field_name, _MSG_REQUIRED_MISSING.format(field_name))
+
+        name = frontmatter.get("name")
+        if isinstance(name, str):
+            if not _is_kebab_case(name):
+                add_error(
+                    "name",
+                    f"'{name}' is not kebab-case",
+                    "Use lowercase letters, digits, and single hyphens",
+                )
+            name_len = len(name)
+            if name_len < 2 or name_len > 30:
+                add_error(
+                    "name", f"Length {name_len} outside allowed range 2-30"
+                )
+        elif name is not None:
+            add_error("name", _MSG_STRING)
+
+        description = frontmatter.get("description")
+        if isinstance(description, str):
+            desc_len = len(description)
+            if desc_len < 10:
+                add_warning(
+                    "description",
+                    f"Only {desc_len} characters",
+                    "Describe what the skill does and when to use it",
+                )
+            if desc_len > 500:
+                add_warning(
+                    "description", f"{desc_len} characters is very long"
+                )
+        elif description is not None:
+            add_error("description", _MSG_STRING)
+
+        version = frontmatter.get("version")
+        if isinstance(version, str):
+            if not _VERSION_RE.match(version):
+                add_error(
+                    "version",
+                    f"'{version}' is not semantic versioning",
+                    "Use MAJOR.MINOR.PATCH, e.g. 1.0.0",
+                )
+        elif version is not None:
+            # YAML happily parses `version: 1.0` as a float; surface
+            # that instead of silently skipping the semver check.
+            add_error("version", _MSG_STRING, "Quote the value, e.g. \"1.0.0\"")
+
+        category = frontmatter.get("category")
+        if category is not None and category not in self.VALID_CATEGORIES:
+            add_warning(
+                "category",
+                f"Unknown category '{category}'",
+                f"Known categories: {self._CATEGORIES_STR}",
+            )
+
+        complexity = frontmatter.get("complexity")
+        if complexity is not None and complexity not in self.VALID_COMPLEXITIES:
+            add_error(
+                "complexity",
+                f"Unknown complexity '{complexity}'",
+                f"Use one of: {self._COMPLEXITIES_STR}",
+            )
+
+    def _validate_intents(self, intents: object, result: ValidationResult) -> None:
+        """Validate the intents section"""
+        if not isinstance(intents, dict):
+            result.add_error("intents", "Must be a mapping")
+            return
+
+        for field_name in sorted(self.REQUIRED_INTENT_FIELDS["intents"] - intents.keys()):
+            result.add_error(
+                f"intents.{field_name}",
+                _MSG_REQUIRED_MISSING.format(field_name),
+            )
+
+        patterns = intents.get("patterns")
+        if patterns is not None:
+            # YAML never yields list subclasses, so the exact type check
+            # (a pointer compare) replaces the isinstance call here and
+            # in the other sequence checks below.
+            if type(patterns) is not list or not patterns:
+                result.add_error("intents.patterns", _MSG_NONEMPTY_ARRAY)
+            else:
+                for pattern in patterns:
+                    if not isinstance(pattern, str) or not _try_compile(pattern):
+                        result.add_error(
+                            "intents.patterns",
+                            f"Invalid regex: {pattern!r}",
+                        )
+
+        examples = intents.get("examples")
+        if examples is not None:
+            if type(examples) is not list or not examples:
+                result.add_error("intents.examples", _MSG_NONEMPTY_ARRAY)
+            else:
+                for example in examples:
+                    if not isinstance(example, str):
+                        result.add_error(
+                            "intents.examples",
+                            f"Example {example!r} is not a string",
+                        )
+
+    def _validate_auto_trigger(self, auto_trigger: object, result: ValidationResult) -> None:
+        """Validate the auto_trigger section"""
+        if not isinstance(auto_trigger, dict):
+            result.add_error("auto_trigger", "Must be a mapping")
+            return
+
+        for field_name in sorted(
+            self.REQUIRED_AUTO_TRIGGER_FIELDS["auto_trigger"] - auto_trigger.keys()
+        ):
+            result.add_error(
+                f"auto_trigger.{field_name}",
+                _MSG_REQUIRED_MISSING.format(field_name),
+            )
+
+        enabled = auto_trigger.get("enabled")
+        if enabled is not None and not isinstance(enabled, bool):
+            result.add_error("auto_trigger.enabled", _MSG_BOOL)
+
+        threshold = auto_trigger.get("threshold")
+        if threshold is not None:
+            # Exact type check: isinstance would accept bool (a subclass
+            # of int), letting `threshold: true` slip through as 1.
+            if type(threshold) not in (int, float):
+                result.add_error("auto_trigger.threshold", "Must be a number")
+            elif threshold < 0 or threshold > 1:
+                result.add_error(
+                    "auto_trigger.threshold",
+                    f"{threshold} outside allowed range 0.0-1.0",
+                )
+
+    def _validate_arguments(self, arguments: object, result: ValidationResult) -> None:
+        """Validate the arguments section"""
+        if type(arguments) is not list:
+            result.add_error("arguments", "Must be an array")
+            return
+
+        for index, arg in enumerate(arguments):
+            label = f"arguments[{index}]"
+            if not isinstance(arg, dict):
+                result.add_error(label, "Must be a mapping")
+                continue
+
+            for field_name in sorted(self.REQUIRED_ARG_FIELDS - arg.keys()):
+                result.add_error(
+                    label, _MSG_REQUIRED_MISSING.format(field_name)
+                )
+
+            arg_name = arg.get("name")
+            if isinstance(arg_name, str):
+                if not _is_snake_case(arg_name):
+                    result.add_error(
+                        label,
+                        f"'{arg_name}' is not snake_case",
+                        "Use lowercase letters, digits, and underscores",
+                    )
+
+            arg_type = arg.get("type")
+            if arg_type is not None and arg_type not in self.VALID_ARG_TYPES:
+                result.add_error(
+                    label,
+                    f"Unknown type '{arg_type}'",
+                    f"Use one of: {self._ARG_TYPES_STR}",
+                )
+
+            required = arg.get("required")
+            if required is not None and not isinstance(required, bool):
+                result.add_error(f"{label}.required", _MSG_BOOL)
+
+            infer_from = arg.get("infer_from")
+            if infer_from is not None and infer_from not in self.VALID_INFER_SOURCES:
+                result.add_error(
+                    f"{label}.infer_from",
+                    f"Unknown source '{infer_from}'",
+                    f"Use one of: {self._INFER_SOURCES_STR}",
+                )
+
+    def _validate_examples(self, examples: object, result: ValidationResult) -> None:
+        """Validate the examples section"""
+        if type(examples) is not list or not examples:
+            result.add_error("examples", _MSG_NONEMPTY_ARRAY)
+            return
+
+        for index, example in enumerate(examples):
+            if not isinstance(example, str):
+                result.add_error(
+                    f"examples[{index}]", f"Example {example!r} is not a string"
+                )
+
+
+# Repeat runs (CI, editor save hooks) mostly see unchanged files; cache
+# results keyed by (absolute path, mtime_ns, size) so those revalidate
+# in microseconds.
+_CACHE_PATH = Path("~/.cache/superclaude/validator.json").expanduser()
+_cache: Optional[Dict[str, Dict]] = None
+
+
+def _load_cache() -> Dict[str, Dict]:
+    """Load the on-disk result cache (once per process)"""
+    global _cache
+    if _cache is None:
+        try:
+            import json
+
+            _cache = json.loads(_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache(cache: Dict[str, Dict]) -> None:
+    """Persist the result cache atomically; failures are non-fatal"""
+    try:
+        import json
+        import os
+
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent runs never observe (or
+        # preserve) a half-written file; the last complete write wins.
+        tmp_path = _CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _cache_key(path: Path) -> Optional[str]:
+    """Fingerprint key for a file, or None when it cannot be stat'ed"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return f"{path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _persist_results(paths: List[str], results: List[ValidationResult]) -> None:
+    """
+    Merge a batch of results into the on-disk cache with one write
+
+    Saving per file would rewrite the whole cache once per miss (O(N²)
+    I/O over a batch), and pool workers each saving their own private
+    copy would clobber each other's entries; persisting once from the
+    parent process after the batch completes avoids both.
+    """
+    cache = _load_cache()
+    for file_path, result in zip(paths, results):
+        key = _cache_key(Path(file_path))
+        if key is not None:
+            cache[key] = result.to_dict()
+    _save_cache(cache)
+
+
+def validate_skill(path: Union[str, Path], use_cache: bool = True) -> ValidationResult:
+    """
+    Validate one SKILL.md file
+
+    Convenience wrapper used by the CLI and other tooling. Cache misses
+    update only the in-process cache; callers validating a batch should
+    persist once afterwards via _persist_results.
+
+    Args:
+        path: Path (or string path) to the SKILL.md file
+        use_cache: Reuse cached results for files whose fingerprint
+            (mtime, size) is unchanged
+
+    Returns:
+        ValidationResult for the file
+    """
+    path = Path(path)
+
+    key = _cache_key(path) if use_cache else None
+    if key is not None:
+        cached = _load_cache().get(key)
+        if cached is not None:
+            try:
+                return ValidationResult.from_dict(cached)
+            except (KeyError, TypeError):
+                # Malformed entry (hand-edited or written by an older
+                # version); fall through and revalidate.
+                pass
+
+    result = SkillValidator().validate_file(path)
+
+    if key is not None:
+        _load_cache()[key] = result.to_dict()
+
+    return result
+
+
+def main() -> int:
+    """
+    CLI entry point
+
+    Returns:
+        Exit code (0 when all files pass, 1 otherwise)
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate SKILL.md frontmatter")
+    parser.add_argument("files", nargs="+", help="SKILL.md files to validate")
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Treat warnings as errors",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Revalidate even when the cached fingerprint matches",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Print only the summary line",
+    )
+    args = parser.parse_args()
+    use_cache = not args.no_cache
+
+    # Each file validates independently (YAML parse + regex checks), so
+    # larger batches fan out across cores; results print serially below
+    # to keep output ordered. Small batches stay in-process to avoid
+    # worker startup overhead.
+    if len(args.files) > 4:
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        worker = partial(validate_skill, use_cache=use_cache)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(worker, args.files))
+    else:
+        results = [
+            validate_skill(file_path, use_cache=use_cache)
+            for file_path in args.files
+        ]
+
+    if use_cache:
+        _persist_results(args.files, results)
+
+    # Assemble the whole report and emit it with one write: large
+    # batches otherwise pay a syscall (and flush) per print call.
+    report: List[str] = []
+    failed = 0
+    for result in results:
+        if not args.quiet:
+            report.append(str(result))
+            report.append("")
+        if not result.valid or (args.strict and result.warnings):
+            failed += 1
+
+    total = len(args.files)
+    report.append(f"📊 {total - failed}/{total} file(s) valid")
+    sys.stdout.write("\n".join(report) + "\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
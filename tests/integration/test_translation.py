@@ -0,0 +1,155 @@
+"""
+Integration tests for the translation -> skill matching pipeline
+
+Verifies that Korean/Japanese queries are mock-translated into English
+phrases, and that the translated form matches the bundled skills where
+the raw query cannot.
+"""
+
+from functools import lru_cache
+
+import pytest
+
+from superclaude.intent import (
+    get_translation_suggestion,
+    mock_translate,
+    translate_queries_batch,
+)
+
+# Mock-translation cases: (query, keywords expected in the English
+# output). One flat table so pytest collects each case as its own item;
+# a failing phrase no longer hides the rest of its former loop, and
+# pytest-xdist can spread the cases across workers.
+CASES = (
+    # Korean: build/implement requests
+    ("로그인 페이지 좀 짜줘", ("write code", "login page")),
+    ("회원가입 페이지 만들어줘", ("build", "signup page")),
+    ("이 기능 구현해줘", ("implement",)),
+    # Korean: troubleshooting
+    ("버그 고쳐줘", ("bug", "fix")),
+    ("에러 해결해줘", ("error", "solve")),
+    ("로그인이 안돼", ("login", "not working")),
+    ("페이지가 느려", ("page", "slow")),
+    # Adjacent phrases in unspaced text must not fuse into one token
+    ("에러페이지", ("error", "page")),
+    ("サーバーエラー", ("error",)),
+    # Korean: analysis/validation
+    ("코드 분석해줘", ("analyze",)),
+    ("구현하기 전에 확신도 체크해줘", ("before implementing", "confidence check")),
+    ("테스트 검증해줘", ("test", "validate")),
+    # Japanese
+    ("ログインページを作って", ("login page", "build")),
+    ("バグを直して", ("bug", "fix")),
+    ("コードを分析して", ("analyze",)),
+    ("ページが遅い", ("page", "slow")),
+)
+
+# Every query the matching tests feed through translate_query. Having
+# them in one place lets the fixture below translate each exactly once.
+CORPUS = (
+    "구현하기 전에 확신도 체크해줘",
+    "implement the login page",
+    "알 수 없는 요청입니다",
+    "",
+    "   ",
+)
+
+
+@lru_cache(maxsize=1024)
+def _lc(text):
+    """
+    Memoized str.lower
+
+    mock_translate is pure, so identical translations recur across
+    cases and repeat runs; each unique string is folded exactly once.
+    """
+    return text.lower()
+
+
+def _contains_any(translated, keywords):
+    """
+    True when any expected keyword appears in the translation
+
+    Probes a set of the translation's words first (one hash hit per
+    keyword); falls back to substring search for multi-word keywords
+    ("login page") and for English embedded in unspaced CJK runs.
+    """
+    lowered = _lc(translated)
+    words = set(lowered.split())
+    return any(kw in words or kw in lowered for kw in keywords)
+
+
+@pytest.fixture(scope="module")
+def translated_queries():
+    """
+    Corpus queries translated once per module
+
+    The same literals are asserted on by several tests; one batch call
+    translates them all and keeps the translator out of the per-test
+    hot loop.
+    """
+    return dict(zip(CORPUS, translate_queries_batch(list(CORPUS))))
+
+
+class TestMockTranslation:
+    """Mock dictionary translation of Korean/Japanese developer phrases"""
+
+    @pytest.mark.parametrize("query,keywords", CASES)
+    def test_known_phrases_translate(self, query, keywords):
+        """Known phrases translate and carry the expected keywords"""
+        translated = mock_translate(query)
+        assert translated != query
+        assert _contains_any(translated, keywords), translated
+
+    def test_suggestion_handles_halfwidth_katakana(self):
+        """Suggestions detect on the normalized form, like translation"""
+        suggestion = get_translation_suggestion("ｴﾗｰ")
+        assert suggestion is not None
+        assert suggestion["original"] == "ｴﾗｰ"
+        assert suggestion["language"] == "ja"
+        assert suggestion["translated"] == "error"
+
+
+@pytest.mark.xdist_group("translation_matcher")
+class TestTranslationWithSkillMatching:
+    """
+    Translated queries flow into SkillMatcher scoring
+
+    Grouped for pytest-xdist: the tests are independent but share the
+    session-scoped matcher, so keeping them on one worker means the
+    pickled snapshot is loaded once instead of per worker.
+    """
+
+    def test_translation_improves_confidence(self, matcher, translated_queries):
+        """Translating a Korean query raises its best match score"""
+        query = "구현하기 전에 확신도 체크해줘"
+        raw_matches = matcher.match(query)
+        translated_matches = matcher.match(translated_queries[query])
+
+        assert translated_matches
+        raw_best = raw_matches[0].score if raw_matches else 0.0
+        assert translated_matches[0].score > raw_best
+
+    def test_english_passthrough(self, matcher):
+        """English queries match directly without translation"""
+        matches = matcher.match("confidence check before implementation")
+        assert matches
+        assert matches[0].skill.name == "Confidence Check"
+
+    def test_translate_english_no_change(self, translated_queries):
+        """English queries come back from the translator unchanged"""
+        query = "implement the login page"
+        assert translated_queries[query] == query
+
+    def test_translate_unknown_korean_fallback(self, translated_queries):
+        """Korean outside the phrase dictionary passes through as-is"""
+        query = "알 수 없는 요청입니다"
+        assert translated_queries[query] == query
+
+    def test_translation_handles_empty_string(self, translated_queries):
+        """Empty input is returned unchanged, not an error"""
+        assert translated_queries[""] == ""
+
+    def test_translation_handles_whitespace(self, translated_queries):
+        """Whitespace-only input is returned unchanged"""
+        assert translated_queries["   "] == "   "
@@ -0,0 +1,98 @@
+"""
+Unit tests for intent tokenizer
+
+Tests language detection and language-aware tokenization.
+"""
+
+from superclaude.intent.tokenizer import (
+    detect_language,
+    smart_tokenize,
+    smart_tokenize_batch,
+    tokenize_japanese,
+    tokenize_korean,
+)
+
+
+class TestDetectLanguage:
+    """Test suite for detect_language"""
+
+    def test_detects_korean(self):
+        """Hangul input is detected as Korean"""
+        assert detect_language("로그인 페이지 만들어줘") == "ko"
+
+    def test_detects_japanese_kana(self):
+        """Kana input is detected as Japanese"""
+        assert detect_language("ログインページを作って") == "ja"
+
+    def test_detects_kanji_only_as_japanese(self):
+        """Han-only input maps to Japanese (no dictionary to split zh/ja)"""
+        assert detect_language("実装") == "ja"
+
+    def test_detects_english(self):
+        """Plain English is detected as English"""
+        assert detect_language("build a login page") == "en"
+
+    def test_empty_string_is_english(self):
+        """Empty input falls back to English"""
+        assert detect_language("") == "en"
+
+
+class TestTokenizeKorean:
+    """Test suite for tokenize_korean"""
+
+    def test_splits_hangul_runs(self):
+        """Hangul runs become individual tokens"""
+        tokens = tokenize_korean("로그인 페이지 만들어줘")
+        assert tokens == ["로그인", "페이지", "만들어줘"]
+
+    def test_mixed_hangul_and_latin(self):
+        """Latin/digit runs are kept as separate lowercase tokens"""
+        tokens = tokenize_korean("API 에러 500 고쳐줘")
+        assert "api" in tokens
+        assert "500" in tokens
+        assert "에러" in tokens
+
+
+class TestTokenizeJapanese:
+    """Test suite for tokenize_japanese"""
+
+    def test_splits_at_script_boundaries(self):
+        """Tokens break where the script changes"""
+        tokens = tokenize_japanese("ログインページを作って")
+        # Katakana run, hiragana particle, kanji run, hiragana suffix
+        assert tokens == ["ログインページ", "を", "作", "って"]
+
+    def test_latin_runs_are_tokens(self):
+        """ASCII alphanumeric runs form their own tokens"""
+        tokens = tokenize_japanese("apiのテスト")
+        assert tokens == ["api", "の", "テスト"]
+
+    def test_separators_are_dropped(self):
+        """Whitespace and punctuation never appear in tokens"""
+        tokens = tokenize_japanese("エラー、直して！")
+        assert tokens == ["エラー", "直", "して"]
+
+    def test_empty_string(self):
+        """Empty input yields no tokens"""
+        assert tokenize_japanese("") == []
+
+
+class TestSmartTokenize:
+    """Test suite for smart_tokenize"""
+
+    def test_english_whitespace_split(self):
+        """English queries are lowercased and split on whitespace"""
+        assert smart_tokenize("Build a Login Page") == ["build", "a", "login", "page"]
+
+    def test_korean_dispatch(self):
+        """Korean queries route to the Korean tokenizer"""
+        assert smart_tokenize("에러 고쳐줘") == ["에러", "고쳐줘"]
+
+    def test_japanese_dispatch(self):
+        """Japanese queries route to the Japanese tokenizer"""
+        assert smart_tokenize("バグを直して") == ["バグ", "を", "直", "して"]
+
+    def test_batch_matches_single_calls(self):
+        """Batch tokenization equals per-query smart_tokenize results"""
+        queries = ["Fix the bug", "에러 고쳐줘", "バグを直して", ""]
+        assert smart_tokenize_batch(queries) == [smart_tokenize(q) for q in queries]
@@ -0,0 +1,215 @@
+"""
+Unit tests for SKILL.md frontmatter validator
+
+Tests schema validation of skill definition files.
+"""
+
+import pytest
+
+from superclaude.skills import validator as validator_module
+from superclaude.skills.validator import SkillValidator, validate_skill
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the on-disk validation cache out of the user's home"""
+    monkeypatch.setattr(validator_module, "_CACHE_PATH", tmp_path / "validator.json")
+    monkeypatch.setattr(validator_module, "_cache", None)
+
+VALID_SKILL = """---
+name: confidence-check
+description: Pre-implementation confidence assessment for PM Agent workflows
+version: 1.0.0
+category: analysis
+complexity: medium
+intents:
+  patterns:
+    - "confidence.*check"
+    - "check.*readiness"
+  examples:
+    - "check my confidence before implementing"
+auto_trigger:
+  enabled: true
+  threshold: 0.8
+arguments:
+  - name: target_file
+    type: string
+    required: true
+    description: File the confidence check applies to
+    infer_from: context
+examples:
+  - "/sc:confidence-check src/main.py"
+---
+
+# Confidence Check Skill
+"""
+
+
+@pytest.fixture
+def skill_file(tmp_path):
+    """Write a SKILL.md with given content and return its path"""
+
+    def _write(content):
+        path = tmp_path / "SKILL.md"
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    return _write
+
+
+class TestSkillValidator:
+    """Test suite for SkillValidator"""
+
+    def test_valid_skill_passes(self, skill_file):
+        """A fully populated, well-formed skill validates cleanly"""
+        result = validate_skill(skill_file(VALID_SKILL))
+        assert result.valid, str(result)
+        assert result.warnings == []
+
+    def test_missing_file_is_error(self, tmp_path):
+        """Nonexistent paths produce a file error, not an exception"""
+        result = validate_skill(tmp_path / "missing" / "SKILL.md")
+        assert not result.valid
+        assert result.errors[0].field == "file"
+
+    def test_unreadable_path_is_error(self, tmp_path):
+        """Existing-but-unreadable paths report a read error, not 'not found'"""
+        result = validate_skill(tmp_path)  # a directory, not a file
+        assert not result.valid
+        assert result.errors[0].field == "file"
+        assert result.errors[0].message == "File could not be read"
+
+    def test_non_utf8_file_is_error(self, tmp_path):
+        """Undecodable bytes produce a parse error, not an exception"""
+        path = tmp_path / "SKILL.md"
+        path.write_bytes(b"---\nname: broken\xff\n---\n")
+        result = validate_skill(path)
+        assert not result.valid
+        assert result.errors[0].field == "frontmatter"
+
+    def test_missing_frontmatter_is_error(self, skill_file):
+        """Files without a frontmatter block fail to validate"""
+        result = validate_skill(skill_file("# Just a heading\n"))
+        assert not result.valid
+        assert result.errors[0].field == "frontmatter"
+
+    def test_yaml_flow_mapping_is_not_mistaken_for_json(self, skill_file):
+        """Brace-delimited YAML flow mappings fall back to the YAML loader"""
+        content = (
+            "---\n"
+            "{name: confidence-check, "
+            "description: Pre-implementation confidence assessment for PM Agent workflows, "
+            "version: 1.0.0}\n"
+            "---\n\nBody\n"
+        )
+        result = validate_skill(skill_file(content))
+        assert result.valid, str(result)
+
+    def test_missing_required_fields(self, skill_file):
+        """Each missing required basic field is reported"""
+        result = validate_skill(skill_file("---\nname: my-skill\n---\n\nBody\n"))
+        assert not result.valid
+        missing = {e.field for e in result.errors}
+        assert "description" in missing
+        assert "version" in missing
+
+    def test_non_kebab_name_is_error(self, skill_file):
+        """Names must be kebab-case"""
+        content = VALID_SKILL.replace("name: confidence-check", "name: Confidence Check")
+        result = validate_skill(skill_file(content))
+        assert not result.valid
+        assert any(e.field == "name" for e in result.errors)
+
+    def test_bad_version_is_error(self, skill_file):
+        """Version must be semantic versioning"""
+        content = VALID_SKILL.replace("version: 1.0.0", "version: v1")
+        result = validate_skill(skill_file(content))
+        assert not result.valid
+        assert any(e.field == "version" for e in result.errors)
+
+    def test_non_string_fields_are_errors(self, skill_file):
+        """Typed fields parsed as non-strings are reported, not skipped"""
+        content = VALID_SKILL.replace(
+            "name: confidence-check", "name: 123"
+        ).replace("version: 1.0.0", "version: 1.0")
+        result = validate_skill(skill_file(content))
+        assert not result.valid
+        typed = {e.field for e in result.errors if e.message == "Must be a string"}
+        assert typed == {"name", "version"}
+
+    def test_short_description_is_warning(self, skill_file):
+        """Very short descriptions warn but do not fail"""
+        content = VALID_SKILL.replace(
+            "description: Pre-implementation confidence assessment for PM Agent workflows",
+            "description: Too short",
+        )
+        result = validate_skill(skill_file(content))
+        assert result.valid
+        assert any(w.field == "description" for w in result.warnings)
+
+    def test_unknown_category_is_warning(self, skill_file):
+        """Unknown categories warn but do not fail"""
+        content = VALID_SKILL.replace("category: analysis", "category: wizardry")
+        result = validate_skill(skill_file(content))
+        assert result.valid
+        assert any(w.field == "category" for w in result.warnings)
+
+    def test_invalid_intent_pattern_is_error(self, skill_file):
+        """Intent patterns must compile as regexes"""
+        content = VALID_SKILL.replace('"confidence.*check"', '"confidence[*check"')
+        result = validate_skill(skill_file(content))
+        assert not result.valid
+        assert any(e.field == "intents.patterns" for e in result.errors)
+
+    def test_threshold_out_of_range_is_error(self, skill_file):
+        """auto_trigger.threshold must be within 0.0-1.0"""
+        content = VALID_SKILL.replace("threshold: 0.8", "threshold: 1.5")
+        result = validate_skill(skill_file(content))
+        assert not result.valid
+        assert any(e.field == "auto_trigger.threshold" for e in result.errors)
+
+    def test_argument_name_must_be_snake_case(self, skill_file):
+        """Argument names must be snake_case"""
+        content = VALID_SKILL.replace("name: target_file", "name: TargetFile")
+        result = validate_skill(skill_file(content))
+        assert not result.valid
+        assert any("arguments[0]" in e.field for e in result.errors)
+
+    def test_unknown_argument_type_is_error(self, skill_file):
+        """Argument types are restricted to the known set"""
+        content = VALID_SKILL.replace("type: string", "type: text")
+        result = validate_skill(skill_file(content))
+        assert not result.valid
+
+    def test_str_reports_errors_and_suggestions(self, skill_file):
+        """The printable report includes counts and suggestions"""
+        content = VALID_SKILL.replace("version: 1.0.0", "version: v1")
+        result = validate_skill(skill_file(content))
+        report = str(result)
+        assert "1 error(s)" in report
+        assert "💡" in report
+
+    def test_cached_result_roundtrip(self, skill_file):
+        """Unchanged files hit the fingerprint cache with equal results"""
+        path = skill_file(VALID_SKILL.replace("version: 1.0.0", "version: v1"))
+        first = validate_skill(path)
+        second = validate_skill(path)
+        assert not second.valid
+        assert str(second) == str(first)
+
+    def test_malformed_cache_entry_revalidates(self, skill_file):
+        """Corrupt cached entries are revalidated, not raised"""
+        path = skill_file(VALID_SKILL)
+        validate_skill(path)
+        cache = validator_module._load_cache()
+        for key in cache:
+            cache[key] = {"unexpected": "shape"}
+        result = validate_skill(path)
+        assert result.valid, str(result)
+
+    def test_validator_is_reusable(self, skill_file):
+        """One validator instance can check multiple files"""
+        validator = SkillValidator()
+        path = skill_file(VALID_SKILL)
+        assert validator.validate_file(path).valid
+        assert validator.validate_file(path).valid